@@ -0,0 +1,3 @@
+"""
+CheckMate ZKP Engine - Python Implementation - Benchmarks
+"""
@@ -0,0 +1,63 @@
+"""
+Benchmark the per-round cost of run_zkp_round before and after VerifierContext.
+
+"Before" replays the original round: re-sorting the nodes to draw sigma, then
+apply_isomorphism and nx.is_isomorphic on every challenge-1 round. "After" is
+run_zkp_round with one VerifierContext shared by all rounds.
+
+Run from the "python" folder:
+
+    python -m benchmarks.bench_context
+"""
+
+import secrets
+import timeit
+from typing import List
+
+import networkx as nx
+
+from src.commitment import commit_permutation, verify_commitment
+from src.context import VerifierContext
+from src.graph import (apply_isomorphism, generate_graph,
+                   generate_random_permutation)
+from src.protocol import run_zkp_round
+
+CASES = [(10, 0.5), (50, 0.3), (200, 0.1)]
+
+
+def baseline_round(G1: nx.Graph, G2: nx.Graph, secret_iso: List[int]) -> bool:
+    """
+    One protocol round as implemented before VerifierContext existed.
+    """
+    sigma = generate_random_permutation(G1)
+    commitment, salt = commit_permutation(sigma)
+    challenge = secrets.randbits(1)
+    if challenge == 0:
+        return verify_commitment(sigma, salt, commitment)
+    response = [secret_iso[sigma[i]] for i in range(len(sigma))]
+    G_prime = apply_isomorphism(G1, response)
+    return nx.is_isomorphic(G_prime, G2)
+
+
+def bench_round(n: int, p: float, repeat: int) -> None:
+    """
+    Print the mean per-round latency of the baseline round and the context round.
+    """
+    G1 = generate_graph(b"bench_context", n=n, p=p)
+    secret_iso = generate_random_permutation(G1)
+    G2 = apply_isomorphism(G1, secret_iso)
+
+    before = timeit.timeit(lambda: baseline_round(G1, G2, secret_iso), number=repeat)
+    context = VerifierContext(G1, G2)
+    after = timeit.timeit(
+        lambda: run_zkp_round(G1, G2, secret_iso, context=context), number=repeat
+    )
+    print(
+        f"n={n:<4} p={p:<4} before: {before / repeat * 1e6:10.1f} us/round"
+        f"   after: {after / repeat * 1e6:8.1f} us/round"
+    )
+
+
+if __name__ == "__main__":
+    for n, p in CASES:
+        bench_round(n, p, repeat=200 if n < 200 else 40)
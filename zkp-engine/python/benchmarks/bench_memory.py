@@ -0,0 +1,82 @@
+"""
+Benchmark the memory cost of a live session with tracemalloc.
+
+Compares the current representation (two networkx graphs, a list permutation,
+a hex-string commitment and a salt) against the compact SessionState, across
+graph sizes and edge probabilities.
+
+Run from the "python" folder:
+
+    python -m benchmarks.bench_memory
+"""
+
+import tracemalloc
+
+from src.commitment import commit_permutation
+from src.graph import (apply_isomorphism, generate_graph,
+                   generate_random_permutation)
+from src.session import SessionState
+
+SESSIONS = 50
+NODES = [10, 50, 100, 200]
+PROBABILITIES = [0.1, 0.3, 0.5]
+
+
+def build_legacy(i: int, n: int, p: float) -> tuple:
+    """
+    Build one session in the current representation.
+    """
+    G1 = generate_graph(i.to_bytes(4, "big"), n=n, p=p)
+    secret_iso = generate_random_permutation(G1)
+    G2 = apply_isomorphism(G1, secret_iso)
+    commitment, salt = commit_permutation(secret_iso)
+    return G1, G2, secret_iso, commitment, salt
+
+
+def build_compact(legacy: tuple) -> SessionState:
+    """
+    Pack a session built by build_legacy into a SessionState.
+    """
+    G1, G2, secret_iso, commitment, salt = legacy
+    session = SessionState.from_graphs(G1, G2, secret_iso)
+    session.record_commitment(commitment, salt)
+    return session
+
+
+def traced_bytes(build) -> int:
+    """
+    Bytes still allocated after build() returns, as seen by tracemalloc.
+    """
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def bench(n: int, p: float) -> None:
+    """
+    Print bytes per session for both representations.
+    """
+    # Warm up caches so they are not charged to the first measurement.
+    build_compact(build_legacy(0, n, p))
+
+    legacy_bytes = traced_bytes(
+        lambda: [build_legacy(i, n, p) for i in range(SESSIONS)]
+    ) / SESSIONS
+    inputs = [build_legacy(i, n, p) for i in range(SESSIONS)]
+    compact_bytes = traced_bytes(
+        lambda: [build_compact(legacy) for legacy in inputs]
+    ) / SESSIONS
+    print(
+        f"n={n:<4} p={p:<4} legacy: {legacy_bytes:10.0f} B/session"
+        f"   compact: {compact_bytes:8.0f} B/session"
+        f"   ratio: {legacy_bytes / compact_bytes:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    for n in NODES:
+        for p in PROBABILITIES:
+            bench(n, p)
@@ -0,0 +1,50 @@
+"""
+Benchmark ReplayCache throughput, memory, fill level and false-positive rate.
+
+Inserts distinct 32-byte items (the size of a SHA-256 commitment) and then
+probes fresh items to measure the observed false-positive rate. The insert
+count defaults to 20 million and can be overridden on the command line:
+
+    python -m benchmarks.bench_replay [inserts]
+"""
+
+import sys
+import time
+
+from src.replay import ReplayCache
+
+PROBES = 200_000
+
+
+def bench(inserts: int, false_positive_rate: float, max_bytes: int) -> None:
+    """
+    Fill a cache with the given number of distinct items and report its statistics.
+    """
+    cache = ReplayCache(
+        false_positive_rate=false_positive_rate, max_bytes=max_bytes, window=3600.0
+    )
+    start = time.perf_counter()
+    for i in range(inserts):
+        cache.check_and_add(i.to_bytes(32, "big"))
+    elapsed = time.perf_counter() - start
+
+    false_hits = 0
+    for i in range(PROBES):
+        if (inserts + i).to_bytes(32, "big") in cache:
+            false_hits += 1
+
+    print(
+        f"inserts={inserts:>11,} target_fp={false_positive_rate:<6g}"
+        f" mem={cache.memory_bytes / 2**20:7.1f} MiB"
+        f" capacity/gen={cache.capacity:>11,}"
+        f" rate={inserts / elapsed / 1e3:7.1f} k/s"
+        f" fill={cache.fill_level:5.2f}"
+        f" est_fp={cache.estimated_false_positive_rate:.2e}"
+        f" observed_fp={false_hits / PROBES:.2e}"
+    )
+
+
+if __name__ == "__main__":
+    inserts = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000
+    bench(inserts, false_positive_rate=1e-6, max_bytes=128 * 2**20)
+    bench(inserts, false_positive_rate=1e-3, max_bytes=32 * 2**20)
@@ -7,6 +7,8 @@ import json
 import secrets
 from typing import List, Optional, Tuple
 
+from .replay import ReplayCache
+
 
 def commit_permutation(
     permutation: List, salt: Optional[bytes] = None
@@ -26,16 +28,30 @@ def commit_permutation(
     return commitment, salt
 
 
-def verify_commitment(permutation: List, salt: bytes, commitment: str) -> bool:
+def verify_commitment(
+    permutation: List,
+    salt: bytes,
+    commitment: str,
+    replay_cache: Optional[ReplayCache] = None,
+) -> bool:
     """
     Verify that a given commitment matches the permutation and salt.
 
     :param permutation: The permutation to verify.
     :param salt: The salt originally used.
     :param commitment: The expected commitment hex digest.
+    :param replay_cache: Optional replay cache. Valid commitments are recorded in
+        it, and one that has already been seen is rejected.
     :return: True if the commitment is valid, False otherwise.
+    :raises ValueError: If the replay cache is full and fails closed.
     """
     perm_bytes = json.dumps(permutation, sort_keys=True).encode("utf-8")
     data = perm_bytes + salt
     expected_commitment = hashlib.sha256(data).hexdigest()
-    return expected_commitment == commitment
+    if expected_commitment != commitment:
+        return False
+    if replay_cache is not None and replay_cache.check_and_add(
+        b"commitment:" + commitment.encode("utf-8")
+    ):
+        return False
+    return True
@@ -0,0 +1,140 @@
+"""
+Module for the session-scoped verifier context used by the CheckMate ZKP Engine.
+"""
+
+import secrets
+from typing import Dict, List, Optional
+
+import networkx as nx
+import numpy as np
+
+from .graph import deterministic_shuffle
+
+
+class VerifierContext:
+    """
+    Precomputed, read-only view of a (G1, G2) pair shared by every round of a session.
+
+    Building the context sorts the node order and flattens G1's edges into
+    index arrays exactly once. Rounds reuse the node order to draw permutations
+    and to validate responses; the structural G1/G2 isomorphism check is
+    computed at most once per context and cached.
+
+    A context belongs to one (G1, G2) pair. After a graph rotation it must be
+    invalidated and rebuilt for the new pair.
+    """
+
+    def __init__(self, G1: nx.Graph, G2: nx.Graph) -> None:
+        """
+        Build the context for a pair of graphs.
+
+        :param G1: Original graph.
+        :param G2: Graph obtained by applying the secret isomorphism to G1.
+        """
+        self.G1 = G1
+        self.G2 = G2
+        self.nodes: List = sorted(G1.nodes())
+        self.index: Dict = {node: i for i, node in enumerate(self.nodes)}
+
+        edges = [(self.index[u], self.index[v]) for u, v in G1.edges()]
+        edge_array = np.array(edges, dtype=np.int64).reshape(-1, 2)
+        self.g1_src: np.ndarray = edge_array[:, 0]
+        self.g1_dst: np.ndarray = edge_array[:, 1]
+
+        self._isomorphic: Optional[bool] = None
+        self._valid = True
+
+    @property
+    def valid(self) -> bool:
+        """
+        Whether the context still describes a live (G1, G2) pair.
+        """
+        return self._valid
+
+    def invalidate(self) -> None:
+        """
+        Mark the context as stale and drop the precomputed structures.
+        """
+        self._valid = False
+        self.G1 = None
+        self.G2 = None
+        self.nodes = []
+        self.index = {}
+        self.g1_src = self.g1_dst = np.empty(0, dtype=np.int64)
+        self._isomorphic = None
+
+    def check(self, G1: nx.Graph, G2: nx.Graph) -> None:
+        """
+        Ensure the context is still valid and was built for the given graphs.
+
+        :raises ValueError: If the context was invalidated or belongs to other graphs.
+        """
+        if not self._valid:
+            raise ValueError("Verifier context has been invalidated")
+        if G1 is not self.G1 or G2 is not self.G2:
+            raise ValueError("Verifier context was built for a different graph pair")
+
+    def random_permutation(self, seed: Optional[int] = None) -> List:
+        """
+        Generate a random permutation of the cached node order.
+
+        Equivalent to ``generate_random_permutation(G1, seed)`` without re-sorting.
+
+        :param seed: Optional integer seed for deterministic shuffling.
+        :return: A permutation list.
+        """
+        if seed is None:
+            permutation = self.nodes.copy()
+            secrets.SystemRandom().shuffle(permutation)
+            return permutation
+        return deterministic_shuffle(self.nodes, seed)
+
+    def _positions(self, permutation: List) -> Optional[np.ndarray]:
+        """
+        Convert a permutation of node labels into node positions.
+
+        :return: Position array, or None if the list is not a permutation of the nodes.
+        """
+        if len(permutation) != len(self.nodes):
+            return None
+        positions = [self.index.get(label) for label in permutation]
+        if None in positions or len(set(positions)) != len(positions):
+            return None
+        return np.array(positions, dtype=np.int64)
+
+    def relabeled_edge_keys(self, permutation: List) -> Optional[List[int]]:
+        """
+        Edge keys of G1 relabeled by a permutation, in sorted order.
+
+        Each undirected edge between node positions i <= j is keyed as
+        ``i * n + j``, so two relabelings give the same keys exactly when they
+        produce the same labelled graph.
+
+        :param permutation: Permutation list mapping sorted G1 nodes to new labels.
+        :return: Sorted edge keys, or None if the list is not a permutation of the nodes.
+        """
+        positions = self._positions(permutation)
+        if positions is None:
+            return None
+        a = positions[self.g1_src]
+        b = positions[self.g1_dst]
+        keys = np.minimum(a, b) * len(self.nodes) + np.maximum(a, b)
+        return np.sort(keys).tolist()
+
+    def is_isomorphic_image(self, permutation: List) -> bool:
+        """
+        Check whether relabeling G1 by the permutation yields a graph isomorphic to G2.
+
+        Relabeling by a bijection never changes the isomorphism class, so this
+        only validates that the response is a permutation of the nodes and
+        reuses the structural G1/G2 check, which is computed once per context.
+        It does not check which isomorphism the permutation encodes.
+
+        :param permutation: Permutation list mapping sorted G1 nodes to new labels.
+        :return: True if the permutation is valid and its image is isomorphic to G2.
+        """
+        if self._positions(permutation) is None:
+            return False
+        if self._isomorphic is None:
+            self._isomorphic = nx.is_isomorphic(self.G1, self.G2)
+        return self._isomorphic
@@ -0,0 +1,189 @@
+"""
+Module for multi-graph challenges in the CheckMate ZKP Engine.
+
+The prover publishes G1 together with 2^b - 1 isomorphic copies, each obtained
+from its own secret permutation. Every round the verifier picks one of the 2^b
+published graphs, so a round yields b bits of soundness instead of one.
+"""
+
+import secrets
+from typing import List, Optional, Tuple
+
+import networkx as nx
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from .commitment import commit_permutation, verify_commitment
+from .context import VerifierContext
+from .graph import apply_isomorphism, generate_random_permutation
+
+
+def derive_copy_permutation(secret: bytes, graph: nx.Graph, index: int) -> List[int]:
+    """
+    Derive the secret permutation for one published copy of a graph.
+
+    Uses HKDF with the copy index as salt, in the same way rotation derives a
+    new secret from a nonce.
+
+    :param secret: Shared secret (bytes).
+    :param graph: The base graph G1.
+    :param index: Index of the copy (1 .. 2^b - 1).
+    :return: A permutation list.
+    """
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=16,
+        salt=index.to_bytes(4, byteorder="big"),
+        info=b"CheckMate multi-graph copy",
+    )
+    copy_secret = hkdf.derive(secret)
+    seed = int.from_bytes(copy_secret, byteorder="big")
+    return generate_random_permutation(graph, seed=seed)
+
+
+def publish_graphs(
+    secret: bytes, G1: nx.Graph, bits: int = 1
+) -> Tuple[List[nx.Graph], List[List[int]]]:
+    """
+    Build the public graphs and secret permutations for b-bit challenges.
+
+    Index 0 is G1 itself with the identity permutation; indexes 1 .. 2^b - 1
+    are isomorphic copies of G1.
+
+    :param secret: Shared secret (bytes).
+    :param G1: The base graph.
+    :param bits: Number of challenge bits per round (b >= 1).
+    :return: Tuple (graphs, secret_isos), both of length 2^b.
+    :raises ValueError: If bits < 1.
+    """
+    if bits < 1:
+        raise ValueError("Number of challenge bits must be at least 1")
+
+    identity = sorted(G1.nodes())
+    graphs = [G1]
+    secret_isos = [identity]
+    for index in range(1, 2 ** bits):
+        secret_iso = derive_copy_permutation(secret, G1, index)
+        graphs.append(apply_isomorphism(G1, secret_iso))
+        secret_isos.append(secret_iso)
+    return graphs, secret_isos
+
+
+def build_contexts(graphs: List[nx.Graph]) -> List[VerifierContext]:
+    """
+    Build one verifier context per published graph.
+
+    The context at index j pairs G_j with G1 and is used to relabel G_j's edges
+    by a response; the context at index 0 also serves the prover's node order.
+
+    :param graphs: Public graphs as returned by publish_graphs.
+    :return: List of contexts aligned with graphs.
+    """
+    G1 = graphs[0]
+    return [VerifierContext(G_j, G1) for G_j in graphs]
+
+
+def _check_published(graphs: List[nx.Graph], secret_isos: List[List[int]]) -> None:
+    """
+    Validate the shape of the published graphs and secret permutations.
+
+    :raises ValueError: If the lists differ in length, their length is not a power
+        of two, or a secret permutation is not a permutation of G1's nodes.
+    """
+    k = len(graphs)
+    if k < 2 or k & (k - 1):
+        raise ValueError("Number of published graphs must be a power of two (at least 2)")
+    if len(secret_isos) != k:
+        raise ValueError("Need exactly one secret permutation per published graph")
+    nodes = set(graphs[0].nodes())
+    for secret_iso in secret_isos:
+        if len(secret_iso) != len(nodes) or set(secret_iso) != nodes:
+            raise ValueError("Secret permutation must be a permutation of G1's nodes")
+
+
+def run_multigraph_round(
+    graphs: List[nx.Graph],
+    secret_isos: List[List[int]],
+    contexts: Optional[List[VerifierContext]] = None,
+) -> Tuple[bool, int, List[int], str, bytes]:
+    """
+    Execute one round of the multi-graph ZKP protocol.
+
+    Steps:
+      1. Prover generates a random permutation (sigma), relabels G1 into
+         H = sigma(G1) and commits to H's edge keys.
+      2. Verifier picks a random challenge c in [0, 2^b).
+      3. Prover responds with rho = sigma ∘ secret_iso_c^-1, which maps the c-th
+         published graph onto H; for c = 0 this is sigma itself.
+      4. Verifier relabels the c-th graph by rho and checks that its edge keys
+         open the commitment exactly.
+
+    A prover that does not know secret_iso_c cannot map G_c onto H, so each
+    round is passed by a cheating prover with probability at most 2^-b.
+
+    :param graphs: Public graphs as returned by publish_graphs.
+    :param secret_isos: Secret permutations as returned by publish_graphs.
+    :param contexts: Optional verifier contexts from build_contexts, reused across rounds.
+    :return: Tuple (valid, challenge, response, commitment, salt).
+    :raises ValueError: If graphs and secret_isos are malformed, or a context is stale.
+    """
+    _check_published(graphs, secret_isos)
+    if contexts is None:
+        contexts = build_contexts(graphs)
+
+    G1 = graphs[0]
+    base = contexts[0]
+    # Prover: Relabel G1 by a random sigma and commit to the resulting edge keys.
+    sigma: List[int] = base.random_permutation()
+    committed_keys = base.relabeled_edge_keys(sigma)
+    commitment, salt = commit_permutation(committed_keys)
+
+    # Verifier: Pick one of the published graphs.
+    challenge: int = secrets.randbelow(len(graphs))
+
+    # Prover: Compute rho with rho[secret_iso_c[u]] = sigma[u].
+    if challenge == 0:
+        response: List[int] = sigma
+    else:
+        secret_iso = secret_isos[challenge]
+        response = list(sigma)
+        for i, label in enumerate(secret_iso):
+            response[base.index[label]] = sigma[i]
+
+    # Verifier: The challenged graph relabeled by rho must be exactly H.
+    context = contexts[challenge]
+    context.check(graphs[challenge], G1)
+    keys = context.relabeled_edge_keys(response)
+    valid = keys is not None and verify_commitment(keys, salt, commitment)
+
+    return valid, challenge, response, commitment, salt
+
+
+def execute_multigraph_protocol(
+    graphs: List[nx.Graph],
+    secret_isos: List[List[int]],
+    rounds: int = 10,
+    contexts: Optional[List[VerifierContext]] = None,
+) -> bool:
+    """
+    Execute the multi-graph ZKP protocol over multiple rounds.
+
+    With 2^b published graphs each round contributes b bits of soundness, so
+    ceil(k / b) rounds match k rounds of the binary protocol.
+
+    :param graphs: Public graphs as returned by publish_graphs.
+    :param secret_isos: Secret permutations as returned by publish_graphs.
+    :param rounds: Number of rounds to execute (default 10).
+    :param contexts: Optional verifier contexts. When omitted, they are built
+        once and shared by all rounds.
+    :return: True if all rounds are valid; False otherwise.
+    """
+    if contexts is None:
+        contexts = build_contexts(graphs)
+    for _ in range(rounds):
+        valid, challenge, response, commitment, salt = run_multigraph_round(
+            graphs, secret_isos, contexts=contexts
+        )
+        if not valid:
+            return False
+    return True
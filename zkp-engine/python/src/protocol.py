@@ -3,16 +3,20 @@ Module for the ZKP protocol orchestration for the CheckMate ZKP Engine.
 """
 
 import secrets
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import networkx as nx
 
 from .commitment import commit_permutation, verify_commitment
-from .graph import apply_isomorphism, generate_random_permutation
+from .context import VerifierContext
+from .session import SessionState
 
 
 def run_zkp_round(
-    G1: nx.Graph, G2: nx.Graph, secret_iso: List[int]
+    G1: nx.Graph,
+    G2: nx.Graph,
+    secret_iso: List[int],
+    context: Optional[VerifierContext] = None,
 ) -> Tuple[bool, int, List[int], str, bytes]:
     """
     Execute one round of the graph isomorphism ZKP protocol.
@@ -28,10 +32,18 @@ def run_zkp_round(
     :param G1: Original graph.
     :param G2: Isomorphic graph (i.e. applying secret_iso to G1 yields G2).
     :param secret_iso: Secret isomorphism as a permutation list.
+    :param context: Optional verifier context for (G1, G2), reused across rounds.
+        A fresh one is built when omitted.
     :return: Tuple (valid, challenge, response, commitment, salt).
+    :raises ValueError: If the context is stale or belongs to other graphs.
     """
+    if context is None:
+        context = VerifierContext(G1, G2)
+    else:
+        context.check(G1, G2)
+
     # Prover: Generate a random permutation sigma and commit.
-    sigma: List[int] = generate_random_permutation(G1)
+    sigma: List[int] = context.random_permutation()
     commitment, salt = commit_permutation(sigma)
 
     # Verifier: Generate a random challenge bit (0 or 1).
@@ -47,14 +59,17 @@ def run_zkp_round(
     if challenge == 0:
         valid = verify_commitment(sigma, salt, commitment)
     else:
-        G_prime = apply_isomorphism(G1, response)
-        valid = nx.is_isomorphic(G_prime, G2)
+        valid = context.is_isomorphic_image(response)
 
     return valid, challenge, response, commitment, salt
 
 
 def execute_protocol(
-    G1: nx.Graph, G2: nx.Graph, secret_iso: List[int], rounds: int = 10
+    G1: nx.Graph,
+    G2: nx.Graph,
+    secret_iso: List[int],
+    rounds: int = 10,
+    context: Optional[VerifierContext] = None,
 ) -> bool:
     """
     Execute the ZKP protocol over multiple rounds.
@@ -65,10 +80,54 @@ def execute_protocol(
     :param G2: Graph obtained by applying the secret isomorphism to G1.
     :param secret_iso: Secret isomorphism as a permutation list.
     :param rounds: Number of rounds to execute (default 10).
+    :param context: Optional verifier context for (G1, G2). When omitted, one is
+        built once and shared by all rounds.
+    :return: True if all rounds are valid; False otherwise.
+    """
+    if context is None:
+        context = VerifierContext(G1, G2)
+    for _ in range(rounds):
+        valid, challenge, response, commitment, salt = run_zkp_round(
+            G1, G2, secret_iso, context=context
+        )
+        if not valid:
+            return False
+    return True
+
+
+def execute_session(
+    session: SessionState,
+    rounds: int = 10,
+    context: Optional[VerifierContext] = None,
+) -> bool:
+    """
+    Execute the ZKP protocol for a compact session state.
+
+    The session's graphs are unpacked once and the secret isomorphism is read
+    straight from the session's buffer, so release() still wipes it. The
+    commitment of the last round is recorded back into the session.
+
+    :param session: Session state holding the graphs and secret isomorphism.
+    :param rounds: Number of rounds to execute (default 10).
+    :param context: Optional verifier context built from session.graphs().
     :return: True if all rounds are valid; False otherwise.
+    :raises ValueError: If the session has been released, or the context is
+        stale or describes other graphs.
     """
+    secret_iso = session.secret_iso
+    if context is None:
+        G1, G2 = session.graphs()
+        context = VerifierContext(G1, G2)
+    else:
+        if not context.valid:
+            raise ValueError("Verifier context has been invalidated")
+        if not session.matches(context.G1, context.G2):
+            raise ValueError("Verifier context does not match the session graphs")
     for _ in range(rounds):
-        valid, challenge, response, commitment, salt = run_zkp_round(G1, G2, secret_iso)
+        valid, challenge, response, commitment, salt = run_zkp_round(
+            context.G1, context.G2, secret_iso, context=context
+        )
+        session.record_commitment(commitment, salt)
         if not valid:
             return False
     return True
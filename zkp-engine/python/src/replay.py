@@ -0,0 +1,229 @@
+"""
+Module for bounded-memory replay detection in the CheckMate ZKP Engine.
+"""
+
+import hashlib
+import math
+import time
+from typing import Callable, List, Union
+
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter over a bytearray, addressed by precomputed bit positions.
+    """
+
+    def __init__(self, num_bits: int) -> None:
+        self.num_bits = num_bits
+        self.bits = bytearray((num_bits + 7) // 8)
+        self.count = 0
+        self.bits_set = 0
+
+    def contains(self, positions: List[int]) -> bool:
+        bits = self.bits
+        for pos in positions:
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def add(self, positions: List[int]) -> None:
+        bits = self.bits
+        added = 0
+        for pos in positions:
+            mask = 1 << (pos & 7)
+            byte = bits[pos >> 3]
+            if not byte & mask:
+                bits[pos >> 3] = byte | mask
+                added += 1
+        self.bits_set += added
+        self.count += 1
+
+    def clear(self) -> None:
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+        self.bits_set = 0
+
+    @property
+    def fill_ratio(self) -> float:
+        return self.bits_set / self.num_bits
+
+
+class ReplayCache:
+    """
+    Time-windowed rotating Bloom filter for rejecting replayed commitments and nonces.
+
+    Memory is split evenly across a fixed number of generations. New items go
+    into the newest generation; lookups consult all of them. The oldest
+    generation is cleared and reused when the newest one has been open for
+    ``window`` seconds, or earlier when it reaches the capacity that keeps the
+    false-positive rate at the configured target. Memory therefore never
+    exceeds the cap.
+
+    With time-driven rotation alone an item is remembered for at least
+    ``target_retention = window * (generations - 1)`` seconds. A
+    capacity-driven rotation evicts items sooner: after it, only items
+    inserted within the last ``retention`` seconds are guaranteed to be
+    detected. Each such early eviction increments ``shortened_rotations``;
+    with ``fail_closed=True`` the cache raises instead of evicting.
+
+    Like any Bloom filter, a fresh item may be reported as seen with a small
+    probability; an item inserted within the last ``retention`` seconds is
+    never missed.
+    """
+
+    def __init__(
+        self,
+        false_positive_rate: float = 1e-6,
+        max_bytes: int = 16 * 1024 * 1024,
+        window: float = 300.0,
+        generations: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+        fail_closed: bool = False,
+    ) -> None:
+        """
+        Create a replay cache.
+
+        :param false_positive_rate: Target false-positive rate for a lookup across
+            all generations, in (0, 1). Each generation is sized for
+            ``false_positive_rate / generations``.
+        :param max_bytes: Memory cap for the filter bits across all generations.
+        :param window: Seconds the newest generation stays open before the
+            oldest one is recycled.
+        :param generations: Number of generations kept (at least 2).
+        :param clock: Monotonic time source, in seconds.
+        :param fail_closed: If True, refuse inserts that would evict items younger
+            than ``target_retention`` instead of recording a shortened rotation.
+        :raises ValueError: If any parameter is out of range.
+        """
+        if not (0 < false_positive_rate < 1):
+            raise ValueError("False-positive rate must be between 0 and 1 (exclusive)")
+        if generations < 2:
+            raise ValueError("Replay cache needs at least 2 generations")
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        num_bits = (max_bytes // generations) * 8
+        if num_bits < 8:
+            raise ValueError("Memory cap is too small for the requested generations")
+
+        ln2 = math.log(2)
+        # Lookups OR across generations, so split the target rate between them.
+        per_generation_rate = false_positive_rate / generations
+        self.false_positive_rate = false_positive_rate
+        self.window = window
+        self.target_retention = window * (generations - 1)
+        self.fail_closed = fail_closed
+        self.shortened_rotations = 0
+        self.num_bits = num_bits
+        self.num_hashes = max(1, round(-math.log2(per_generation_rate)))
+        # Items a generation can hold before exceeding its share of the rate.
+        self.capacity = max(1, int(num_bits * ln2 * ln2 / -math.log(per_generation_rate)))
+        self._clock = clock
+        self._filters = [_BloomFilter(num_bits) for _ in range(generations)]
+        self._current = 0
+        self._starts = [clock()] * generations
+
+    def _positions(self, item: Union[bytes, str]) -> List[int]:
+        """
+        Map an item to its bit positions using double hashing over a BLAKE2b digest.
+        """
+        if isinstance(item, str):
+            item = item.encode("utf-8")
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        m = self.num_bits
+        pos = int.from_bytes(digest[:8], byteorder="little") % m
+        step = (int.from_bytes(digest[8:], byteorder="little") | 1) % m
+        positions = []
+        for _ in range(self.num_hashes):
+            positions.append(pos)
+            pos += step
+            if pos >= m:
+                pos -= m
+        return positions
+
+    def _maybe_rotate(self) -> None:
+        now = self._clock()
+        if now - self._starts[self._current] < self.window:
+            if self._filters[self._current].count < self.capacity:
+                return
+            # After rotating, the oldest live generation is the one after the
+            # cleared one; anything older than its start is forgotten. Clearing
+            # an empty generation evicts nothing.
+            cleared = self._filters[(self._current + 1) % len(self._filters)]
+            oldest_after = (self._current + 2) % len(self._filters)
+            if (
+                cleared.count > 0
+                and now - self._starts[oldest_after] < self.target_retention
+            ):
+                if self.fail_closed:
+                    raise ValueError(
+                        "Replay cache is full; rotating would shorten retention below the window"
+                    )
+                self.shortened_rotations += 1
+        self._current = (self._current + 1) % len(self._filters)
+        self._filters[self._current].clear()
+        self._starts[self._current] = now
+
+    def __contains__(self, item: Union[bytes, str]) -> bool:
+        positions = self._positions(item)
+        return any(f.contains(positions) for f in self._filters)
+
+    def add(self, item: Union[bytes, str]) -> None:
+        """
+        Record an item in the newest generation.
+
+        :raises ValueError: If the cache is full and fail_closed is set.
+        """
+        self._maybe_rotate()
+        self._filters[self._current].add(self._positions(item))
+
+    def check_and_add(self, item: Union[bytes, str]) -> bool:
+        """
+        Record an item and report whether it had been seen before.
+
+        :param item: Commitment, nonce or other replay-sensitive value.
+        :return: True if the item is (probably) a replay, False if it is new.
+        :raises ValueError: If the cache is full and fail_closed is set.
+        """
+        self._maybe_rotate()
+        positions = self._positions(item)
+        if any(f.contains(positions) for f in self._filters):
+            return True
+        self._filters[self._current].add(positions)
+        return False
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Bytes used by the filter bits across all generations.
+        """
+        return sum(len(f.bits) for f in self._filters)
+
+    @property
+    def retention(self) -> float:
+        """
+        Seconds since the oldest live generation started.
+
+        Items inserted within this many seconds are guaranteed to be detected.
+        It drops below target_retention after a capacity-driven rotation.
+        """
+        oldest = (self._current + 1) % len(self._filters)
+        return self._clock() - self._starts[oldest]
+
+    @property
+    def fill_level(self) -> float:
+        """
+        Fraction of the newest generation's capacity already used.
+        """
+        return self._filters[self._current].count / self.capacity
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        """
+        Estimated probability that a fresh item is reported as a replay.
+
+        Computed from the fraction of bits set in each generation.
+        """
+        miss = 1.0
+        for f in self._filters:
+            miss *= 1.0 - f.fill_ratio ** self.num_hashes
+        return 1.0 - miss
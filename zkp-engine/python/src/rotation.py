@@ -2,17 +2,27 @@
 Module for graph rotation functions for the CheckMate ZKP Engine.
 """
 
-from typing import List, Tuple
+import hashlib
+import hmac
+from typing import List, Optional, Tuple
 
 import networkx as nx
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
-from .graph import generate_graph, generate_random_permutation
+from .context import VerifierContext
+from .graph import apply_isomorphism, generate_graph, generate_random_permutation
+from .replay import ReplayCache
+from .session import SessionState
 
 
 def rotate_graph(
-    secret: bytes, nonce: bytes, n: int = 10, p: float = 0.3
+    secret: bytes,
+    nonce: bytes,
+    n: int = 10,
+    p: float = 0.3,
+    context: Optional[VerifierContext] = None,
+    replay_cache: Optional[ReplayCache] = None,
 ) -> Tuple[nx.Graph, List[int]]:
     """
     Rotate the graph and secret isomorphism using a new nonce.
@@ -24,8 +34,21 @@ def rotate_graph(
     :param nonce: A secure random nonce (bytes).
     :param n: Number of nodes for the new graph.
     :param p: Probability of edge creation for the new graph.
+    :param context: Optional verifier context for the outgoing graph pair. It is
+        invalidated so that it cannot be reused against the rotated graphs.
+    :param replay_cache: Optional replay cache. The nonce is recorded in it, keyed
+        by the secret, and a nonce already used with the same secret is rejected.
     :return: Tuple (new_G1, new_secret_iso).
+    :raises ValueError: If the nonce is found in the replay cache, or the cache
+        is full and fails closed.
     """
+    if replay_cache is not None:
+        nonce_key = hmac.new(secret, nonce, hashlib.sha256).digest()
+        if replay_cache.check_and_add(b"nonce:" + nonce_key):
+            raise ValueError("Rotation nonce has already been used")
+    if context is not None:
+        context.invalidate()
+
     hkdf = HKDF(
         algorithm=hashes.SHA256(),
         length=16,  # Use a fixed length (e.g., 16 bytes) for the seed.
@@ -38,3 +61,40 @@ def rotate_graph(
     new_seed = int.from_bytes(new_secret, byteorder="big")
     new_secret_iso = generate_random_permutation(new_G1, seed=new_seed)
     return new_G1, new_secret_iso
+
+
+def rotate_session(
+    secret: bytes,
+    nonce: bytes,
+    n: int = 10,
+    p: float = 0.3,
+    session: Optional[SessionState] = None,
+    context: Optional[VerifierContext] = None,
+    replay_cache: Optional[ReplayCache] = None,
+) -> SessionState:
+    """
+    Rotate into a new compact session state.
+
+    Same derivation as rotate_graph. The outgoing session's secret material is
+    released and its verifier context invalidated. The temporary permutation
+    list returned by rotate_graph is cleared once it has been packed.
+
+    :param secret: Original shared secret (bytes).
+    :param nonce: A secure random nonce (bytes).
+    :param n: Number of nodes for the new graph.
+    :param p: Probability of edge creation for the new graph.
+    :param session: Optional outgoing session state to release.
+    :param context: Optional verifier context for the outgoing graph pair.
+    :param replay_cache: Optional replay cache used to reject reused nonces.
+    :return: The new SessionState.
+    :raises ValueError: If the nonce is found in the replay cache.
+    """
+    new_G1, new_secret_iso = rotate_graph(
+        secret, nonce, n=n, p=p, context=context, replay_cache=replay_cache
+    )
+    if session is not None:
+        session.release()
+    new_G2 = apply_isomorphism(new_G1, new_secret_iso)
+    new_session = SessionState.from_graphs(new_G1, new_G2, new_secret_iso)
+    new_secret_iso[:] = [0] * len(new_secret_iso)
+    return new_session
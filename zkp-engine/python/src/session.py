@@ -0,0 +1,199 @@
+"""
+Module for compact per-session state in the CheckMate ZKP Engine.
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+
+import networkx as nx
+
+from .commitment import commit_permutation
+
+
+def _typecode(n: int) -> str:
+    """
+    Pick the smallest unsigned array type code able to hold node labels below n.
+    """
+    if n <= 0xFF + 1:
+        return "B"
+    if n <= 0xFFFF + 1:
+        return "H"
+    return "I"
+
+
+def _edge_array(graph: nx.Graph, typecode: str) -> array:
+    """
+    Flatten a graph's edges into an array of alternating endpoints.
+    """
+    edges = array(typecode)
+    for u, v in graph.edges():
+        edges.append(u)
+        edges.append(v)
+    return edges
+
+
+def _edge_set(edges: array) -> set:
+    """
+    Normalise a flattened edge array into a set of (low, high) endpoint pairs.
+    """
+    return {(u, v) if u <= v else (v, u) for u, v in zip(edges[0::2], edges[1::2])}
+
+
+def _edge_graph(n: int, edges: array) -> nx.Graph:
+    """
+    Rebuild a graph with nodes 0..n-1 from a flattened edge array.
+    """
+    graph = nx.Graph()
+    graph.add_nodes_from(range(n))
+    graph.add_edges_from(zip(edges[0::2], edges[1::2]))
+    return graph
+
+
+class SessionState:
+    """
+    Compact state for one live ZKP session.
+
+    Graphs and the secret isomorphism are stored as fixed-width arrays and the
+    commitment as a raw SHA-256 digest, instead of networkx graphs, Python lists
+    and hex strings. Secret material (the isomorphism and the salt) lives in
+    mutable buffers so release() can overwrite it in place. release() can only
+    wipe buffers the session owns: lists passed to from_graphs are copied, and
+    any copy a caller makes of secret_iso is not wiped.
+
+    Graphs must be labelled 0..n-1, as produced by generate_graph.
+    """
+
+    __slots__ = ("n", "g1_edges", "g2_edges", "_secret_iso", "commitment", "_salt")
+
+    def __init__(
+        self, n: int, g1_edges: array, g2_edges: array, secret_iso: array
+    ) -> None:
+        """
+        Create a session state from already-packed arrays.
+
+        Use from_graphs to build one from networkx graphs.
+
+        :param n: Number of nodes.
+        :param g1_edges: Flattened edge array of G1.
+        :param g2_edges: Flattened edge array of G2.
+        :param secret_iso: Secret isomorphism as an array.
+        """
+        self.n = n
+        self.g1_edges = g1_edges
+        self.g2_edges = g2_edges
+        self._secret_iso: Optional[array] = secret_iso
+        self.commitment: Optional[bytes] = None
+        self._salt: Optional[bytearray] = None
+
+    @classmethod
+    def from_graphs(
+        cls, G1: nx.Graph, G2: nx.Graph, secret_iso: List[int]
+    ) -> "SessionState":
+        """
+        Pack a (G1, G2, secret_iso) triple into a session state.
+
+        :param G1: Original graph.
+        :param G2: Graph obtained by applying the secret isomorphism to G1.
+        :param secret_iso: Secret isomorphism as a permutation list. It is copied
+            into the session; the caller's list is not wiped by release().
+        :return: A new SessionState.
+        :raises ValueError: If the graphs are not labelled 0..n-1.
+        """
+        n = G1.number_of_nodes()
+        labels = set(range(n))
+        if set(G1.nodes()) != labels or set(G2.nodes()) != labels:
+            raise ValueError("Session graphs must be labelled 0..n-1")
+        typecode = _typecode(n)
+        return cls(
+            n,
+            _edge_array(G1, typecode),
+            _edge_array(G2, typecode),
+            array(typecode, secret_iso),
+        )
+
+    @property
+    def released(self) -> bool:
+        """
+        Whether the secret material has been released.
+        """
+        return self._secret_iso is None
+
+    @property
+    def secret_iso(self) -> array:
+        """
+        The secret isomorphism, as the session's own array buffer.
+
+        No copy is made, so release() wipes what callers hold; converting it
+        to a list creates a copy that release() cannot reach.
+
+        :raises ValueError: If the session has been released.
+        """
+        if self._secret_iso is None:
+            raise ValueError("Session secret material has been released")
+        return self._secret_iso
+
+    def matches(self, G1: nx.Graph, G2: nx.Graph) -> bool:
+        """
+        Check whether a pair of graphs has exactly this session's nodes and edges.
+
+        :param G1: Candidate original graph.
+        :param G2: Candidate isomorphic graph.
+        :return: True if both graphs equal the session's graphs.
+        """
+        labels = set(range(self.n))
+        if set(G1.nodes()) != labels or set(G2.nodes()) != labels:
+            return False
+        typecode = self.g1_edges.typecode
+        return _edge_set(_edge_array(G1, typecode)) == _edge_set(
+            self.g1_edges
+        ) and _edge_set(_edge_array(G2, typecode)) == _edge_set(self.g2_edges)
+
+    def graphs(self) -> Tuple[nx.Graph, nx.Graph]:
+        """
+        Rebuild the session's graphs as networkx graphs.
+
+        :return: Tuple (G1, G2).
+        """
+        return _edge_graph(self.n, self.g1_edges), _edge_graph(self.n, self.g2_edges)
+
+    def record_commitment(self, commitment: str, salt: bytes) -> None:
+        """
+        Store the latest commitment as a raw digest together with its salt.
+
+        :param commitment: Commitment hex digest, as returned by commit_permutation.
+        :param salt: The salt used for the commitment.
+        """
+        self._wipe_salt()
+        self.commitment = bytes.fromhex(commitment)
+        self._salt = bytearray(salt)
+
+    def verify_commitment(self, permutation: List) -> bool:
+        """
+        Check a revealed permutation against the stored commitment and salt.
+
+        Uses the same encoding as commitment.verify_commitment.
+
+        :param permutation: The permutation to verify.
+        :return: True if the commitment is valid, False otherwise.
+        """
+        if self.commitment is None or self._salt is None:
+            return False
+        expected, _ = commit_permutation(permutation, salt=bytes(self._salt))
+        return bytes.fromhex(expected) == self.commitment
+
+    def _wipe_salt(self) -> None:
+        if self._salt is not None:
+            self._salt[:] = bytes(len(self._salt))
+            self._salt = None
+
+    def release(self) -> None:
+        """
+        Overwrite and drop the secret isomorphism and salt.
+
+        Public material (graphs and commitment) stays available.
+        """
+        if self._secret_iso is not None:
+            for i in range(len(self._secret_iso)):
+                self._secret_iso[i] = 0
+            self._secret_iso = None
+        self._wipe_salt()
@@ -0,0 +1,107 @@
+import networkx as nx
+import pytest
+
+from src.context import VerifierContext
+from src.graph import (apply_isomorphism, generate_graph,
+                   generate_random_permutation)
+from src.protocol import execute_protocol, run_zkp_round
+from src.rotation import rotate_graph
+
+
+def _pair(secret, n=10, p=0.5):
+    G1 = generate_graph(secret, n=n, p=p)
+    secret_iso = generate_random_permutation(G1)
+    G2 = apply_isomorphism(G1, secret_iso)
+    return G1, G2, secret_iso
+
+
+def test_context_precomputes_node_order_and_edges():
+    G1, G2, _ = _pair(b"context_build")
+    context = VerifierContext(G1, G2)
+    assert context.nodes == sorted(G1.nodes())
+    assert len(context.g1_src) == G1.number_of_edges()
+
+
+def test_context_random_permutation_matches_graph_module():
+    G1, G2, _ = _pair(b"context_perm")
+    context = VerifierContext(G1, G2)
+    seed = 123456
+    assert context.random_permutation(seed=seed) == generate_random_permutation(
+        G1, seed=seed
+    )
+    assert sorted(context.random_permutation()) == sorted(G1.nodes())
+
+
+def test_context_relabeled_edge_keys():
+    G1, G2, secret_iso = _pair(b"context_keys")
+    context = VerifierContext(G1, G2)
+    g2_context = VerifierContext(G2, G2)
+    identity = sorted(G2.nodes())
+    # The secret isomorphism relabels G1 into exactly G2.
+    assert context.relabeled_edge_keys(secret_iso) == g2_context.relabeled_edge_keys(
+        identity
+    )
+    assert context.relabeled_edge_keys(identity) != g2_context.relabeled_edge_keys(
+        identity
+    )
+    assert context.relabeled_edge_keys(secret_iso[:-1]) is None
+
+
+def test_context_accepts_round_responses():
+    G1, G2, secret_iso = _pair(b"context_response")
+    context = VerifierContext(G1, G2)
+    for _ in range(5):
+        sigma = context.random_permutation()
+        response = [secret_iso[sigma[i]] for i in range(len(sigma))]
+        assert context.is_isomorphic_image(response)
+
+
+def test_context_rejects_non_permutation():
+    G1, G2, secret_iso = _pair(b"context_reject")
+    context = VerifierContext(G1, G2)
+    tampered = secret_iso.copy()
+    tampered[0] = tampered[1]
+    assert not context.is_isomorphic_image(tampered)
+    assert not context.is_isomorphic_image(secret_iso[:-1])
+
+
+def test_context_matches_networkx_isomorphism_check():
+    G1, G2, _ = _pair(b"context_nx")
+    context = VerifierContext(G1, G2)
+    for _ in range(5):
+        perm = generate_random_permutation(G1)
+        expected = nx.is_isomorphic(apply_isomorphism(G1, perm), G2)
+        assert context.is_isomorphic_image(perm) == expected
+
+
+def test_context_detects_non_isomorphic_pair():
+    G1 = generate_graph(b"context_a", n=10, p=0.5)
+    G2 = nx.empty_graph(10)
+    context = VerifierContext(G1, G2)
+    assert not context.is_isomorphic_image(generate_random_permutation(G1))
+
+
+def test_protocol_reuses_context():
+    G1, G2, secret_iso = _pair(b"context_protocol")
+    context = VerifierContext(G1, G2)
+    for _ in range(5):
+        valid, _, _, _, _ = run_zkp_round(G1, G2, secret_iso, context=context)
+        assert valid
+    assert execute_protocol(G1, G2, secret_iso, rounds=10, context=context)
+
+
+def test_context_rejects_other_graphs():
+    G1, G2, secret_iso = _pair(b"context_other")
+    H1, H2, _ = _pair(b"context_other_b")
+    context = VerifierContext(H1, H2)
+    with pytest.raises(ValueError):
+        run_zkp_round(G1, G2, secret_iso, context=context)
+
+
+def test_rotate_graph_invalidates_context():
+    G1, G2, secret_iso = _pair(b"context_rotate")
+    context = VerifierContext(G1, G2)
+    rotate_graph(b"context_rotate", b"nonce", n=10, p=0.5, context=context)
+    assert not context.valid
+    with pytest.raises(ValueError):
+        run_zkp_round(G1, G2, secret_iso, context=context)
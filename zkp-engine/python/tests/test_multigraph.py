@@ -0,0 +1,105 @@
+import networkx as nx
+import pytest
+
+from src.graph import generate_graph
+from src.multigraph import (build_contexts, derive_copy_permutation,
+                        execute_multigraph_protocol, publish_graphs,
+                        run_multigraph_round)
+
+
+def test_publish_graphs_count_and_isomorphism():
+    secret = b"multigraph_publish"
+    G1 = generate_graph(secret, n=10, p=0.5)
+    graphs, secret_isos = publish_graphs(secret, G1, bits=3)
+    assert len(graphs) == 8 and len(secret_isos) == 8
+    assert graphs[0] is G1
+    for G_j in graphs[1:]:
+        assert nx.is_isomorphic(G1, G_j), "Every published copy must be isomorphic to G1."
+
+
+def test_copy_permutations_are_deterministic_and_distinct():
+    secret = b"multigraph_derive"
+    G1 = generate_graph(secret, n=10, p=0.5)
+    perm_a = derive_copy_permutation(secret, G1, 1)
+    assert perm_a == derive_copy_permutation(secret, G1, 1)
+    assert perm_a != derive_copy_permutation(secret, G1, 2)
+    assert sorted(perm_a) == sorted(G1.nodes())
+
+
+def test_publish_graphs_invalid_bits():
+    G1 = generate_graph(b"multigraph_bits", n=5, p=0.5)
+    with pytest.raises(ValueError):
+        publish_graphs(b"multigraph_bits", G1, bits=0)
+
+
+def test_multigraph_round_is_valid():
+    secret = b"multigraph_round"
+    G1 = generate_graph(secret, n=10, p=0.5)
+    graphs, secret_isos = publish_graphs(secret, G1, bits=2)
+    contexts = build_contexts(graphs)
+    challenges = set()
+    for _ in range(40):
+        valid, challenge, response, commitment, salt = run_multigraph_round(
+            graphs, secret_isos, contexts=contexts
+        )
+        assert valid, f"Multi-graph round failed (challenge {challenge})."
+        assert 0 <= challenge < 4
+        challenges.add(challenge)
+    assert len(challenges) > 1, "Challenges should span several published graphs."
+
+
+def test_execute_multigraph_protocol():
+    secret = b"multigraph_execute"
+    G1 = generate_graph(secret, n=10, p=0.5)
+    graphs, secret_isos = publish_graphs(secret, G1, bits=4)
+    assert execute_multigraph_protocol(graphs, secret_isos, rounds=3)
+
+
+def test_multigraph_rejects_prover_without_copy_permutations():
+    secret = b"multigraph_cheat"
+    G1 = generate_graph(secret, n=10, p=0.5)
+    graphs, secret_isos = publish_graphs(secret, G1, bits=3)
+    identity = sorted(G1.nodes())
+    # A prover that only knows G1 can answer challenge 0 but no other.
+    assert not execute_multigraph_protocol(graphs, [identity] * 8, rounds=30)
+    wrong = [identity] + [secret_isos[1]] * 7
+    assert not execute_multigraph_protocol(graphs, wrong, rounds=30)
+
+
+def test_multigraph_round_rejects_wrong_response_challenge():
+    secret = b"multigraph_wrong"
+    G1 = generate_graph(secret, n=10, p=0.5)
+    graphs, secret_isos = publish_graphs(secret, G1, bits=2)
+    contexts = build_contexts(graphs)
+    swapped = [secret_isos[0], secret_isos[2], secret_isos[1], secret_isos[3]]
+    for _ in range(40):
+        valid, challenge, _, _, _ = run_multigraph_round(
+            graphs, swapped, contexts=contexts
+        )
+        assert valid == (challenge in (0, 3))
+
+
+def test_multigraph_round_validates_shapes():
+    secret = b"multigraph_shapes"
+    G1 = generate_graph(secret, n=6, p=0.5)
+    graphs, secret_isos = publish_graphs(secret, G1, bits=2)
+    with pytest.raises(ValueError):
+        run_multigraph_round(graphs, secret_isos[:-1])
+    with pytest.raises(ValueError):
+        run_multigraph_round(graphs[:3], secret_isos[:3])
+    with pytest.raises(ValueError):
+        run_multigraph_round(graphs[:1], secret_isos[:1])
+
+
+def test_multigraph_round_rejects_malformed_permutation():
+    secret = b"multigraph_malformed"
+    G1 = generate_graph(secret, n=6, p=0.5)
+    graphs, secret_isos = publish_graphs(secret, G1, bits=1)
+    duplicated = list(secret_isos[1])
+    duplicated[0] = duplicated[1]
+    with pytest.raises(ValueError):
+        run_multigraph_round(graphs, [secret_isos[0], duplicated])
+    with pytest.raises(ValueError):
+        run_multigraph_round(graphs, [secret_isos[0], secret_isos[1][:-1]])
+    with pytest.raises(ValueError):
+        run_multigraph_round(graphs, [secret_isos[0], secret_isos[1] + [99]])
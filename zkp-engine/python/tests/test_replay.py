@@ -0,0 +1,174 @@
+import pytest
+
+from src.commitment import commit_permutation, verify_commitment
+from src.replay import ReplayCache
+from src.rotation import rotate_graph
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_replay_cache_detects_repeat():
+    cache = ReplayCache(max_bytes=64 * 1024)
+    assert not cache.check_and_add(b"item")
+    assert cache.check_and_add(b"item")
+    # Strings are recorded by their UTF-8 encoding.
+    assert "item" in cache
+    assert b"other" not in cache
+
+
+def test_replay_cache_invalid_parameters():
+    with pytest.raises(ValueError):
+        ReplayCache(false_positive_rate=0)
+    with pytest.raises(ValueError):
+        ReplayCache(generations=1)
+    with pytest.raises(ValueError):
+        ReplayCache(window=0)
+    with pytest.raises(ValueError):
+        ReplayCache(max_bytes=1)
+
+
+def test_replay_cache_respects_memory_cap():
+    cap = 32 * 1024
+    cache = ReplayCache(max_bytes=cap, generations=4)
+    for i in range(10 * cache.capacity):
+        cache.add(i.to_bytes(8, "big"))
+    assert cache.memory_bytes <= cap
+    assert cache.fill_level <= 1.0
+
+
+def test_replay_cache_expires_after_window():
+    clock = FakeClock()
+    cache = ReplayCache(max_bytes=64 * 1024, window=10, generations=2, clock=clock)
+    cache.add(b"old")
+    clock.now = 11
+    cache.add(b"newer")
+    # Still retained for one more window.
+    assert b"old" in cache
+    clock.now = 22
+    cache.add(b"newest")
+    assert b"old" not in cache
+    assert b"newer" in cache
+
+
+def test_replay_cache_reports_fill_and_false_positive_rate():
+    cache = ReplayCache(false_positive_rate=1e-3, max_bytes=16 * 1024)
+    assert cache.fill_level == 0
+    assert cache.estimated_false_positive_rate == 0
+    n = cache.capacity // 2
+    for i in range(n):
+        cache.add(i.to_bytes(8, "big"))
+    assert cache.fill_level == pytest.approx(0.5, abs=0.01)
+    assert 0 < cache.estimated_false_positive_rate < 1e-3
+    false_hits = sum(
+        (i.to_bytes(8, "big") + b"x") in cache for i in range(20000)
+    )
+    assert false_hits / 20000 < 1e-2
+
+
+def test_verify_commitment_rejects_replay():
+    cache = ReplayCache(max_bytes=64 * 1024)
+    permutation = [2, 0, 1]
+    commitment, salt = commit_permutation(permutation)
+    assert verify_commitment(permutation, salt, commitment, replay_cache=cache)
+    assert not verify_commitment(permutation, salt, commitment, replay_cache=cache)
+
+
+def test_invalid_commitment_is_not_recorded():
+    cache = ReplayCache(max_bytes=64 * 1024)
+    permutation = [2, 0, 1]
+    commitment, salt = commit_permutation(permutation)
+    assert not verify_commitment([0, 1, 2], salt, commitment, replay_cache=cache)
+    assert verify_commitment(permutation, salt, commitment, replay_cache=cache)
+
+
+def test_rotate_graph_rejects_reused_nonce():
+    cache = ReplayCache(max_bytes=64 * 1024)
+    rotate_graph(b"replay_secret", b"nonce", n=5, p=0.5, replay_cache=cache)
+    with pytest.raises(ValueError):
+        rotate_graph(b"replay_secret", b"nonce", n=5, p=0.5, replay_cache=cache)
+    rotate_graph(b"replay_secret", b"other_nonce", n=5, p=0.5, replay_cache=cache)
+
+
+def test_replay_cache_capacity_rotation_shortens_retention():
+    clock = FakeClock()
+    cache = ReplayCache(max_bytes=1024, window=3600, clock=clock)
+    assert cache.target_retention == 3600
+    cache.add(b"nonce")
+    clock.now = 5
+    for i in range(3 * cache.capacity):
+        cache.add(i.to_bytes(8, "big"))
+    # Capacity-driven rotation evicted the item well inside the window.
+    assert b"nonce" not in cache
+    assert cache.shortened_rotations > 0
+    assert cache.retention < cache.target_retention
+
+
+def test_replay_cache_time_rotation_keeps_retention():
+    clock = FakeClock()
+    cache = ReplayCache(max_bytes=64 * 1024, window=10, clock=clock)
+    for t in range(0, 50, 11):
+        clock.now = t
+        cache.add(t.to_bytes(8, "big"))
+    assert cache.shortened_rotations == 0
+    assert cache.retention >= cache.target_retention
+
+
+@pytest.mark.parametrize("generations", [2, 4])
+def test_replay_cache_fail_closed(generations):
+    clock = FakeClock()
+    cache = ReplayCache(
+        max_bytes=4096,
+        window=3600,
+        generations=generations,
+        clock=clock,
+        fail_closed=True,
+    )
+    cache.add(b"nonce")
+    # The whole memory cap is usable inside one window.
+    for i in range(generations * cache.capacity - 1):
+        cache.add(i.to_bytes(8, "big"))
+    assert cache.shortened_rotations == 0
+    assert b"nonce" in cache
+    # The next insert would evict the first generation early.
+    with pytest.raises(ValueError):
+        cache.add(b"overflow")
+    assert b"nonce" in cache
+    # Once the window has passed, rotation is allowed again.
+    clock.now = 3601
+    cache.add(b"later")
+    assert b"later" in cache
+
+
+def test_replay_cache_counts_only_real_evictions():
+    clock = FakeClock()
+    cache = ReplayCache(max_bytes=4096, window=3600, generations=4, clock=clock)
+    for i in range(4 * cache.capacity):
+        cache.add(i.to_bytes(8, "big"))
+    assert cache.shortened_rotations == 0
+    cache.add(b"overflow")
+    assert cache.shortened_rotations == 1
+
+
+def test_replay_cache_rate_covers_all_generations():
+    clock = FakeClock()
+    cache = ReplayCache(
+        false_positive_rate=1e-2, max_bytes=16 * 1024, generations=4, clock=clock
+    )
+    # Fill every generation up to capacity.
+    for i in range(4 * cache.capacity):
+        cache.add(i.to_bytes(8, "big"))
+    assert cache.estimated_false_positive_rate <= 1.2e-2
+
+
+def test_rotate_graph_nonce_is_scoped_to_secret():
+    cache = ReplayCache(max_bytes=64 * 1024)
+    rotate_graph(b"secret_a", b"shared_nonce", n=5, p=0.5, replay_cache=cache)
+    rotate_graph(b"secret_b", b"shared_nonce", n=5, p=0.5, replay_cache=cache)
+    with pytest.raises(ValueError):
+        rotate_graph(b"secret_a", b"shared_nonce", n=5, p=0.5, replay_cache=cache)
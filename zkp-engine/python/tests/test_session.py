@@ -0,0 +1,102 @@
+import networkx as nx
+import pytest
+
+from src.commitment import commit_permutation
+from src.graph import (apply_isomorphism, generate_graph,
+                   generate_random_permutation)
+from src.protocol import execute_session
+from src.rotation import rotate_graph, rotate_session
+from src.context import VerifierContext
+from src.session import SessionState
+
+
+def _session(secret, n=10, p=0.5):
+    G1 = generate_graph(secret, n=n, p=p)
+    secret_iso = generate_random_permutation(G1)
+    G2 = apply_isomorphism(G1, secret_iso)
+    return G1, G2, secret_iso, SessionState.from_graphs(G1, G2, secret_iso)
+
+
+def test_session_round_trips_graphs():
+    G1, G2, secret_iso, session = _session(b"session_pack")
+    H1, H2 = session.graphs()
+    assert nx.utils.edges_equal(H1.edges(), G1.edges())
+    assert nx.utils.edges_equal(H2.edges(), G2.edges())
+    assert session.secret_iso.tolist() == secret_iso
+
+
+def test_session_uses_slots_and_compact_types():
+    _, _, _, session = _session(b"session_slots")
+    assert not hasattr(session, "__dict__")
+    assert session.g1_edges.typecode == "B"
+    _, _, _, large = _session(b"session_large", n=300, p=0.01)
+    assert large.g1_edges.typecode == "H"
+
+
+def test_session_commitment_raw_digest():
+    _, _, secret_iso, session = _session(b"session_commit")
+    commitment, salt = commit_permutation(secret_iso)
+    session.record_commitment(commitment, salt)
+    assert len(session.commitment) == 32
+    assert session.verify_commitment(secret_iso)
+    assert not session.verify_commitment(list(reversed(secret_iso)))
+
+
+def test_session_release_wipes_secret_material():
+    _, _, secret_iso, session = _session(b"session_release")
+    commitment, salt = commit_permutation(secret_iso)
+    session.record_commitment(commitment, salt)
+    iso_buffer = session.secret_iso
+    salt_buffer = session._salt
+    session.release()
+    assert session.released
+    assert not any(iso_buffer) and not any(salt_buffer)
+    with pytest.raises(ValueError):
+        session.secret_iso
+    # Public material is still available.
+    assert session.commitment is not None
+    session.graphs()
+
+
+def test_session_rejects_non_integer_labels():
+    G1 = nx.relabel_nodes(generate_graph(b"session_labels", n=5, p=0.5), str)
+    with pytest.raises(ValueError):
+        SessionState.from_graphs(G1, G1, list(G1.nodes()))
+
+
+def test_execute_session():
+    _, _, _, session = _session(b"session_execute")
+    assert execute_session(session, rounds=10)
+    assert session.commitment is not None
+
+
+def test_rotate_session_releases_old_state():
+    _, _, _, session = _session(b"session_rotate")
+    new_session = rotate_session(b"session_rotate", b"nonce", n=10, p=0.5, session=session)
+    assert session.released
+    new_G1, new_secret_iso = rotate_graph(b"session_rotate", b"nonce", n=10, p=0.5)
+    assert new_session.secret_iso.tolist() == new_secret_iso
+    assert nx.utils.edges_equal(new_session.graphs()[0].edges(), new_G1.edges())
+    assert execute_session(new_session, rounds=5)
+
+
+def test_execute_session_reuses_matching_context():
+    _, _, _, session = _session(b"session_context")
+    context = VerifierContext(*session.graphs())
+    assert execute_session(session, rounds=5, context=context)
+    assert execute_session(session, rounds=5, context=context)
+
+
+def test_execute_session_rejects_foreign_context():
+    _, _, _, session = _session(b"session_foreign")
+    H1, H2, _, _ = _session(b"session_other")
+    with pytest.raises(ValueError):
+        execute_session(session, rounds=5, context=VerifierContext(H1, H2))
+
+
+def test_execute_session_rejects_invalidated_context():
+    _, _, _, session = _session(b"session_stale")
+    context = VerifierContext(*session.graphs())
+    context.invalidate()
+    with pytest.raises(ValueError):
+        execute_session(session, rounds=5, context=context)